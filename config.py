@@ -2,155 +2,175 @@
 Configuration management for Analytics Dashboard Server
 Centralizes all configuration settings and table mappings
 """
+import functools
+import logging
 import os
+from dataclasses import dataclass, field
 from datetime import timedelta
+from types import MappingProxyType
+
+# Fallback to template placeholders if server-config.py not found
+# (table type, display label, date field)
+_FALLBACK_META = [
+    ('ghl', 'GHL', 'Date Created'),
+    ('pos', 'POS', 'Created'),
+    ('meta_ads', 'Meta Ads', 'Reporting ends'),
+    ('meta_ads_summary', 'Meta Ads Summary', 'Reporting ends'),
+    ('meta_ads_simplified', 'Meta Ads Simplified', 'period'),
+    ('google_ads', 'Google Ads', 'Date')
+]
+_FALLBACK_FRESH_TABLES = {
+    table_type: {
+        'id': f'CLIENT_{table_type.upper()}_TABLE_ID',
+        'name': f'CLIENT_NAME {label}',
+        'date_field': date_field,
+        'sort_direction': 'desc'
+    }
+    for table_type, label, date_field in _FALLBACK_META
+}
+
+# Table Mappings - Fresh Tables (Primary)
+# Now dynamically generated from centralized client configuration.
+# Resolved lazily on first access of FRESH_TABLES (see _load_fresh_tables()).
+_FRESH_TABLES = None
+
+# Reverse lookup index (table ID -> read-only table config), built with FRESH_TABLES
+_ID_INDEX = None
+_ALL_IDS = None
+
+def _load_fresh_tables():
+    """
+    Get FRESH_TABLES, loading it from server-config.py on first use.
+    Shared by all settings instances, so it is only built once per process.
+    """
+    global _FRESH_TABLES, _ID_INDEX, _ALL_IDS
+
+    if _FRESH_TABLES is None:
+        try:
+            from server_config import ClientConfig
+            fresh_tables = ClientConfig.get_fresh_tables()
+        except ImportError:
+            fresh_tables = _FALLBACK_FRESH_TABLES
+
+        # First table wins when several share an ID (matches the original linear scan)
+        id_index = {}
+        for table_type, config in fresh_tables.items():
+            id_index.setdefault(
+                config['id'],
+                MappingProxyType({**config, 'type': table_type, 'is_legacy': False})
+            )
+        all_ids = tuple(config['id'] for config in fresh_tables.values())
+
+        # Publish fully built state; _FRESH_TABLES goes last as the single
+        # "loaded" guard, so concurrent readers never see a partial index
+        _ID_INDEX = id_index
+        _ALL_IDS = all_ids
+        _FRESH_TABLES = fresh_tables
+    return _FRESH_TABLES
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings; defaults are the common settings for every environment"""
+
+    DEBUG: bool = False
 
-class Config:
-    """Base configuration class with common settings"""
-    
     # API Configuration
-    CLAUDE_API_URL = 'https://api.anthropic.com/v1/messages'
-    AIRTABLE_BASE_URL = 'https://api.airtable.com/v0'
-    
+    CLAUDE_API_URL: str = 'https://api.anthropic.com/v1/messages'
+    AIRTABLE_BASE_URL: str = 'https://api.airtable.com/v0'
+
     # Server Configuration
-    HOST = '127.0.0.1'
-    PORT = 8000
-    
+    HOST: str = '127.0.0.1'
+    PORT: int = 8000
+
     # Request Timeouts (in seconds)
-    CLAUDE_API_TIMEOUT = 30
-    AIRTABLE_API_TIMEOUT = 15
-    
+    CLAUDE_API_TIMEOUT: int = 30
+    AIRTABLE_API_TIMEOUT: int = 15
+
     # Pagination Settings
-    MAX_RECORDS_PER_REQUEST = 100  # Airtable API limit
-    MAX_TOTAL_RECORDS = 10000      # Safety limit for large requests
-    MAX_PAGINATION_PAGES = 50      # Prevent infinite loops
-    
+    MAX_RECORDS_PER_REQUEST: int = 100  # Airtable API limit
+    MAX_TOTAL_RECORDS: int = 10000      # Safety limit for large requests
+    MAX_PAGINATION_PAGES: int = 50      # Prevent infinite loops
+
     # Logging Configuration
-    LOG_LEVEL = 'INFO'
-    LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'
-    LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
-    LOG_FILE_MAX_BYTES = 10 * 1024 * 1024  # 10MB
-    LOG_BACKUP_COUNT = 5
-    
+    LOG_LEVEL: str = 'INFO'
+    LOG_FORMAT: str = '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'
+    LOG_DATE_FORMAT: str = '%Y-%m-%d %H:%M:%S'
+    LOG_FILE_MAX_BYTES: int = 10 * 1024 * 1024  # 10MB
+    LOG_BACKUP_COUNT: int = 5
+
     # Security Settings
-    CORS_ORIGINS = ['http://localhost:3000', 'http://localhost:8000', 'http://127.0.0.1:8000']
-    
-    # Table Mappings - Fresh Tables (Primary)
-    # Now dynamically generated from centralized client configuration
-    try:
-        from server_config import ClientConfig
-        FRESH_TABLES = ClientConfig.get_fresh_tables()
-    except ImportError:
-        # Fallback to template placeholders if server-config.py not found
-        FRESH_TABLES = {
-            'ghl': {
-                'id': 'CLIENT_GHL_TABLE_ID',
-                'name': 'CLIENT_NAME GHL',
-                'date_field': 'Date Created',
-                'sort_direction': 'desc'
-            },
-            'pos': {
-                'id': 'CLIENT_POS_TABLE_ID',
-                'name': 'CLIENT_NAME POS',
-                'date_field': 'Created',
-                'sort_direction': 'desc'
-            },
-            'meta_ads': {
-                'id': 'CLIENT_META_ADS_TABLE_ID',
-                'name': 'CLIENT_NAME Meta Ads',
-                'date_field': 'Reporting ends',
-                'sort_direction': 'desc'
-            },
-            'meta_ads_summary': {
-                'id': 'CLIENT_META_ADS_SUMMARY_TABLE_ID',
-                'name': 'CLIENT_NAME Meta Ads Summary',
-                'date_field': 'Reporting ends',
-                'sort_direction': 'desc'
-            },
-            'meta_ads_simplified': {
-                'id': 'CLIENT_META_ADS_SIMPLIFIED_TABLE_ID',
-                'name': 'CLIENT_NAME Meta Ads Simplified',
-                'date_field': 'period',
-                'sort_direction': 'desc'
-            },
-            'google_ads': {
-                'id': 'CLIENT_GOOGLE_ADS_TABLE_ID',
-                'name': 'CLIENT_NAME Google Ads',
-                'date_field': 'Date',
-                'sort_direction': 'desc'
-            }
-        }
-    
+    CORS_ORIGINS: frozenset = frozenset({'http://localhost:3000', 'http://localhost:8000', 'http://127.0.0.1:8000'})
+
     # Legacy Table Mappings - ELIMINATED for centralized configuration
     # All table configurations now come from server-config.py
-    LEGACY_TABLES = {
-        # Legacy tables completely disabled - using only centralized FRESH_TABLES
-    }
-    
-    @classmethod
-    def get_table_config(cls, table_id):
+    # (excluded from hash/eq - dicts are unhashable)
+    LEGACY_TABLES: dict = field(default_factory=dict, hash=False, compare=False)
+
+    @property
+    def FRESH_TABLES(self):
+        """Fresh table mappings, loaded from server-config.py on first access"""
+        return _load_fresh_tables()
+
+    def fresh_tables(self):
+        """Get FRESH_TABLES, loading it from server-config.py on first use"""
+        return _load_fresh_tables()
+
+    def get_table_config(self, table_id):
         """
         Get table configuration by table ID.
-        Returns table config dict or None if not found.
+        Returns the shared read-only table config or None if not found.
         """
-        # Check fresh tables first
-        for table_type, config in cls.FRESH_TABLES.items():
-            if config['id'] == table_id:
-                return {**config, 'type': table_type, 'is_legacy': False}
-        
+        if _FRESH_TABLES is None:
+            _load_fresh_tables()
+
         # Legacy tables disabled - only using centralized FRESH_TABLES
-        # (Legacy table checking removed)
-        
-        return None
-    
-    @classmethod
-    def get_all_table_ids(cls):
+        return _ID_INDEX.get(table_id)
+
+    def get_all_table_ids(self):
         """Get all known table IDs (only fresh tables for centralized config)"""
-        fresh_ids = [config['id'] for config in cls.FRESH_TABLES.values()]
-        return fresh_ids
-
-class DevelopmentConfig(Config):
-    """Development-specific configuration"""
-    DEBUG = True
-    LOG_LEVEL = 'DEBUG'
-    
-    # More verbose logging in development
-    LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(name)-15s | %(funcName)-20s | %(message)s'
-
-class ProductionConfig(Config):
-    """Production-specific configuration"""
-    DEBUG = False
-    LOG_LEVEL = 'INFO'
-    
-    # Production optimizations
-    MAX_TOTAL_RECORDS = 5000  # Lower limit for production
-    
-    # Stricter CORS in production
-    CORS_ORIGINS = ['http://localhost:8000', 'http://127.0.0.1:8000']
-
-class TestConfig(Config):
-    """Test-specific configuration"""
-    DEBUG = True
-    LOG_LEVEL = 'WARNING'  # Less verbose during tests
-    
-    # Test limits
-    MAX_TOTAL_RECORDS = 100
-    MAX_PAGINATION_PAGES = 5
+        if _FRESH_TABLES is None:
+            _load_fresh_tables()
+        return _ALL_IDS
+
+# Environment-specific overrides of the Settings defaults
+_ENV_OVERRIDES = {
+    'development': {
+        'DEBUG': True,
+        'LOG_LEVEL': 'DEBUG',
+        # More verbose logging in development
+        'LOG_FORMAT': '%(asctime)s | %(levelname)-8s | %(name)-15s | %(funcName)-20s | %(message)s'
+    },
+    'production': {
+        'DEBUG': False,
+        'LOG_LEVEL': 'INFO',
+        # Production optimizations
+        'MAX_TOTAL_RECORDS': 5000,  # Lower limit for production
+        # Stricter CORS in production
+        'CORS_ORIGINS': frozenset({'http://localhost:8000', 'http://127.0.0.1:8000'})
+    },
+    'testing': {
+        'DEBUG': True,
+        'LOG_LEVEL': 'WARNING',  # Less verbose during tests
+        # Test limits
+        'MAX_TOTAL_RECORDS': 100,
+        'MAX_PAGINATION_PAGES': 5
+    }
+}
+
+# Active environment, read once at import
+_FLASK_ENV = os.getenv('FLASK_ENV', 'production').lower()
 
 # Configuration factory
+@functools.lru_cache(maxsize=1)
 def get_config():
     """
     Get the appropriate configuration based on environment.
-    Returns the config class to use.
+    Returns the Settings instance to use (built once per process).
     """
-    env = os.getenv('FLASK_ENV', 'production').lower()
-    
-    if env == 'development':
-        return DevelopmentConfig
-    elif env == 'testing':
-        return TestConfig
-    else:
-        return ProductionConfig
+    return Settings(**_ENV_OVERRIDES.get(_FLASK_ENV, _ENV_OVERRIDES['production']))
 
 # Export the active configuration
 AppConfig = get_config()
+
+# Log formatter for the active configuration, built once and shared by all handlers
+LOG_FORMATTER = logging.Formatter(AppConfig.LOG_FORMAT, datefmt=AppConfig.LOG_DATE_FORMAT, style='%')
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """
-Main entry point - redirects to server.py
+Main entry point - runs server.py as __main__
 This file exists as a fallback in case Railway looks for main.py
 """
+import runpy
 
 if __name__ == '__main__':
-    import server
-    server.start_server()
+    runpy.run_module('server', run_name='__main__')
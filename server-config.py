@@ -6,14 +6,33 @@ CUSTOMIZER INSTRUCTIONS:
 - Replace Cellular Zone with actual client name
 - Replace app9JgRBZC2GNlaKM with client's Airtable base ID
 - Replace table IDs with client's actual table IDs
-- Set enabled/disabled data sources based on client needs
+- Set ENABLED_SOURCES based on client needs (DISABLED_SOURCES is derived:
+  every source in TABLE_IDS that is not enabled)
 """
+import functools
+import sys
+
+# Shared sort direction for every fresh table
+_DESC = sys.intern('desc')
+
+# ===== DATA SOURCE METADATA =====
+# Display label and date field for each data source, in FRESH_TABLES order
+_SOURCE_META = {
+    'ghl': ('GHL', 'Date Created'),
+    'pos': ('POS', 'Created'),
+    'google_ads': ('Google Ads', 'Date'),
+    'meta_ads': ('Meta Ads', 'Reporting ends'),
+    'meta_ads_summary': ('Meta Ads Summary', 'Reporting ends'),
+    'meta_ads_simplified': ('Meta Ads Simplified', 'period'),
+    'meta_ads_performance': ('Meta Ads Performance', 'Date')
+}
 
 class ClientConfig:
     """Centralized client configuration for server-side operations"""
     
     # ===== CLIENT INFORMATION =====
     CLIENT_NAME = 'Cellular Zone'
+    CLIENT_ID = CLIENT_NAME.lower().replace(' ', '_')  # Derived - do not edit
     BUSINESS_NAME = 'Cellular Zone'
     
     # ===== AIRTABLE CONFIGURATION =====
@@ -31,87 +50,31 @@ class ClientConfig:
     }
     
     # ===== DATA SOURCE CONFIGURATION =====
-    ENABLED_SOURCES = ['ghl', 'google_ads']
-    DISABLED_SOURCES = []
+    ENABLED_SOURCES = ('ghl', 'google_ads')  # Display order for frontend tabs
+    _ENABLED = frozenset(ENABLED_SOURCES)     # Membership checks
+    _ALL_SOURCES = frozenset(TABLE_IDS)
+    DISABLED_SOURCES = _ALL_SOURCES - _ENABLED  # Derived - do not edit
+    
+    # Precomputed at import - table IDs and enabled sources never change at runtime
+    _CLEAN_IDS = {k: v for k, v in TABLE_IDS.items() if v and v != 'null'}
+    _VALID = frozenset(_CLEAN_IDS) & _ENABLED
     
     # ===== TABLE MAPPINGS FOR FRESH_TABLES =====
     @classmethod
     def get_fresh_tables(cls):
-        """Generate FRESH_TABLES configuration based on client settings"""
-        fresh_tables = {}
-        
-        if cls.is_enabled('ghl'):
-            fresh_tables['ghl'] = {
-                'id': cls.TABLE_IDS['ghl'],
-                'name': f'{cls.CLIENT_NAME} GHL',
-                'date_field': 'Date Created',
-                'sort_direction': 'desc'
-            }
-        
-        if cls.is_enabled('pos'):
-            fresh_tables['pos'] = {
-                'id': cls.TABLE_IDS['pos'],
-                'name': f'{cls.CLIENT_NAME} POS',
-                'date_field': 'Created',
-                'sort_direction': 'desc'
-            }
-        
-        if cls.is_enabled('google_ads'):
-            fresh_tables['google_ads'] = {
-                'id': cls.TABLE_IDS['google_ads'],
-                'name': f'{cls.CLIENT_NAME} Google Ads',
-                'date_field': 'Date',
-                'sort_direction': 'desc'
-            }
-        
-        if cls.is_enabled('meta_ads'):
-            fresh_tables['meta_ads'] = {
-                'id': cls.TABLE_IDS['meta_ads'],
-                'name': f'{cls.CLIENT_NAME} Meta Ads',
-                'date_field': 'Reporting ends',
-                'sort_direction': 'desc'
-            }
-        
-        if cls.is_enabled('meta_ads_summary'):
-            fresh_tables['meta_ads_summary'] = {
-                'id': cls.TABLE_IDS['meta_ads_summary'],
-                'name': f'{cls.CLIENT_NAME} Meta Ads Summary',
-                'date_field': 'Reporting ends',
-                'sort_direction': 'desc'
-            }
-        
-        if cls.is_enabled('meta_ads_simplified'):
-            fresh_tables['meta_ads_simplified'] = {
-                'id': cls.TABLE_IDS['meta_ads_simplified'],
-                'name': f'{cls.CLIENT_NAME} Meta Ads Simplified',
-                'date_field': 'period',
-                'sort_direction': 'desc'
-            }
-        
-        if cls.is_enabled('meta_ads_performance'):
-            fresh_tables['meta_ads_performance'] = {
-                'id': cls.TABLE_IDS['meta_ads_performance'],
-                'name': f'{cls.CLIENT_NAME} Meta Ads Performance',
-                'date_field': 'Date',
-                'sort_direction': 'desc'
-            }
-        
-        return fresh_tables
+        """Get FRESH_TABLES configuration based on client settings (cached)"""
+        return _cached_fresh_tables()
     
     # ===== HELPER METHODS =====
     @classmethod
     def is_enabled(cls, data_source):
         """Check if a data source is enabled"""
-        return (data_source in cls.ENABLED_SOURCES and 
-                cls.TABLE_IDS.get(data_source) is not None and
-                cls.TABLE_IDS.get(data_source) != 'null' and
-                cls.TABLE_IDS.get(data_source) != '')
+        return data_source in cls._VALID
     
     @classmethod
     def get_table_id(cls, data_source):
         """Get table ID for a data source"""
-        table_id = cls.TABLE_IDS.get(data_source)
-        return table_id if table_id and table_id != 'null' and table_id != '' else None
+        return cls._CLEAN_IDS.get(data_source)
     
     @classmethod
     def get_base_id(cls):
@@ -120,39 +83,67 @@ class ClientConfig:
     
     @classmethod
     def get_client_config_for_frontend(cls):
-        """Generate client configuration for frontend use"""
-        return {
-            "client_info": {
-                "client_id": cls.CLIENT_NAME.lower().replace(' ', '_'),
-                "business_name": cls.BUSINESS_NAME
-            },
-            "data_sources": {
-                "enabled_sources": cls.ENABLED_SOURCES,
-                "disabled_sources": cls.DISABLED_SOURCES
-            },
-            "tab_configuration": {
-                "enabled_tabs": ["overview"] + cls.ENABLED_SOURCES,
-                "default_tab": "overview"
-            },
-            "airtable_configuration": {
-                "base_id": cls.AIRTABLE_BASE_ID
-            }
+        """
+        Get client configuration for frontend use.
+        Precomputed at import; each call returns a fresh copy of the dict
+        levels, while the immutable leaves (strings, tuples) are shared.
+        """
+        return {section: dict(values) for section, values in _FRONTEND_CONFIG.items()}
+
+# ===== CACHED BUILDERS =====
+# Client settings are class-level constants that never change at runtime,
+# so each configuration is built once per process and shared by all callers.
+
+@functools.lru_cache(maxsize=1)
+def _cached_fresh_tables():
+    """Generate FRESH_TABLES configuration based on client settings"""
+    prefix = sys.intern(ClientConfig.CLIENT_NAME)
+    return {
+        source: {
+            'id': ClientConfig.TABLE_IDS[source],
+            'name': sys.intern(f'{prefix} {label}'),
+            'date_field': date_field,
+            'sort_direction': _DESC
+        }
+        for source, (label, date_field) in _SOURCE_META.items()
+        if ClientConfig.is_enabled(source)
+    }
+
+def _build_client_config_for_frontend():
+    """
+    Generate client configuration for frontend use.
+    disabled_sources lists every TABLE_IDS source not in ENABLED_SOURCES.
+    """
+    enabled_sources = tuple(ClientConfig.ENABLED_SOURCES)
+    return {
+        "client_info": {
+            "client_id": ClientConfig.CLIENT_ID,
+            "business_name": ClientConfig.BUSINESS_NAME
+        },
+        "data_sources": {
+            "enabled_sources": enabled_sources,
+            "disabled_sources": tuple(sorted(ClientConfig.DISABLED_SOURCES))
+        },
+        "tab_configuration": {
+            "enabled_tabs": ("overview",) + enabled_sources,
+            "default_tab": "overview"
+        },
+        "airtable_configuration": {
+            "base_id": ClientConfig.AIRTABLE_BASE_ID
         }
+    }
+
+# Frontend config, built once; lists are stored as tuples so the values
+# shared between callers cannot be mutated
+_FRONTEND_CONFIG = _build_client_config_for_frontend()
 
 # ===== LEGACY COMPATIBILITY =====
 # Keep these for backward compatibility with existing code
 
-def get_client_config():
-    """Get client configuration (legacy compatibility)"""
-    return ClientConfig.get_client_config_for_frontend()
-
-def get_base_id():
-    """Get base ID (legacy compatibility)"""
-    return ClientConfig.get_base_id()
-
-def get_fresh_tables():
-    """Get fresh tables configuration (legacy compatibility)"""
-    return ClientConfig.get_fresh_tables()
+# Bound classmethod aliases - no extra call frame per invocation
+get_client_config = ClientConfig.get_client_config_for_frontend
+get_base_id = ClientConfig.get_base_id
+get_fresh_tables = ClientConfig.get_fresh_tables
 
 # Export for easy importing
 __all__ = ['ClientConfig', 'get_client_config', 'get_base_id', 'get_fresh_tables']
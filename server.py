@@ -9,7 +9,7 @@ from collections import defaultdict
 import time
 import logging
 from logging.handlers import RotatingFileHandler
-from config import AppConfig
+from config import AppConfig, LOG_FORMATTER
 import hashlib
 import pickle
 
@@ -116,11 +116,8 @@ def setup_logging():
     if not os.path.exists('logs'):
         os.makedirs('logs')
 
-    # Configure logging format
-    log_format = logging.Formatter(
-        AppConfig.LOG_FORMAT,
-        datefmt=AppConfig.LOG_DATE_FORMAT
-    )
+    # Configure logging format (prebuilt once in config)
+    log_format = LOG_FORMATTER
 
     # Configure root logger
     logger = logging.getLogger()